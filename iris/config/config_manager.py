@@ -1,28 +1,113 @@
-
-import tomllib
-from dataclasses import dataclass
-from pathlib import Path
-from abc import ABC, abstractmethod
-from typing import final
+import functools
+import mmap
 import os
+import sys
+import threading
+import weakref
+from abc import ABC
+from dataclasses import dataclass, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import ClassVar, Self, final
+
 from dotenv import load_dotenv
 
-load_dotenv()
+# Prefer the Rust-backed `rtoml` parser when installed
+try:
+    import rtoml as _toml
+except ImportError:
+    import tomllib as _toml
+
+# Environment settings, read once on first use (see `_ensure_env_loaded()`)
+_BASE_PATH: Path | None = None
+_BASE_CONFIG_PATH: Path | None = None
+
+
+def _reload_env() -> None:
+    """Re-read the environment variables the base config depends on."""
+    global _BASE_PATH, _BASE_CONFIG_PATH
+
+    base_path = os.getenv('BASE_PATH')
+    base_config_path = os.getenv('BASE_CONFIG_PATH')
+    _BASE_PATH = Path(base_path) if base_path is not None else None
+    _BASE_CONFIG_PATH = (
+        _BASE_PATH / base_config_path
+        if _BASE_PATH is not None and base_config_path is not None
+        else None
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_env_loaded() -> bool:
+    """Load `.env` and read the environment settings, once per process."""
+    load_dotenv()
+    _reload_env()
+    return True
+
+
+_MMAP_THRESHOLD = 64 * 1024  # Bytes
+
+
+@functools.lru_cache(maxsize=128)
+def _load_toml_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a TOML file, memoized on its path, modification time and size.
+
+    The `mtime_ns` and `size` arguments are only part of the cache key, so
+    an edited file is re-parsed on the next load. The file is read into
+    memory in one call and parsed from the decoded string. Files of at
+    least `_MMAP_THRESHOLD` bytes are read through a prefaulted memory map.
+    """
+    with open(path_str, "rb") as f:
+        if size >= _MMAP_THRESHOLD and hasattr(mmap, "MAP_POPULATE"):
+            # Prefault all pages up front rather than on demand (Linux only)
+            with mmap.mmap(
+                f.fileno(),
+                0,
+                flags=mmap.MAP_PRIVATE | mmap.MAP_POPULATE,
+                prot=mmap.PROT_READ
+            ) as mm:
+                raw = mm[:]
+        else:
+            raw = f.read()
+
+    return _intern_strings(_toml.loads(raw.decode("utf-8")))
+
+
+def _intern_strings(value):
+    """
+    Recursively intern all keys and string values in parsed TOML data.
+
+    Selectors, patterns and key names repeat across config files, so
+    interning lets every loaded config share a single copy of each string.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(k): _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    return value
 
-@dataclass(frozen=True)
+
+def _shallow_asdict(obj) -> dict:
+    """
+    Return a dataclass instance's fields as a dict, without copying values.
+
+    Unlike `dataclasses.asdict`, this does not recurse into or deep-copy
+    nested containers, which is unnecessary for frozen configs. Fields
+    with `init=False` are derived in `__post_init__` and are left out, so
+    the result can be passed straight back to the constructor.
+    """
+    return {f.name: getattr(obj, f.name) for f in fields(obj) if f.init}
+
+
+@dataclass(frozen=True, slots=True)
 class BaseConfig:
     """Base configuration with environment settings."""
     
     config_dir: Path
-    _config_paths: dict[str, Path]
-    shop_config_path: Path
-    mongodb_config_path: Path
-    image_store_config_path: Path
-    qdrant_config_path: Path
-    scraper_config_path: Path
-    clip_config_path: Path
-    embeddingdb_config_path: Path
-    localization_config_path: Path
+    _config_paths: dict[str, Path]  # Resolved in __post_init__, see `path()`
 
     base_path: Path = None  # Will be set in __post_init__ from environment variable
     environment: str = "dev"  # Default to development environment
@@ -30,13 +115,31 @@ class BaseConfig:
     
     def __post_init__(self):
         """Post-initialization to ensure base_path is set."""
-        object.__setattr__(self, "base_path", Path(os.getenv('BASE_PATH')))
-        object.__setattr__(self, "config_dir", self.base_path / Path(self.config_dir))
+        _ensure_env_loaded()
+        base_path = _BASE_PATH
+        config_dir = base_path / self.config_dir
+        object.__setattr__(self, "base_path", base_path)
+        object.__setattr__(self, "config_dir", config_dir)
         
-        # Convert config_paths values to Path objects and prepend base_path
-        for config_name, path in self._config_paths.items():
-            config_path = self.base_path / self.config_dir / path
-            object.__setattr__(self, config_name, config_path)
+        # Convert config_paths values to Path objects rooted at config_dir,
+        # which already includes base_path
+        object.__setattr__(self, "_config_paths", {
+            config_name: config_dir / path
+            for config_name, path in self._config_paths.items()
+        })
+
+    def path(self, config_name: str) -> Path:
+        """
+        Get the resolved path of a config file.
+
+        Args:
+            config_name (str): Key of the path in `_config_paths`, e.g.
+                               `"scraper_config_path"`.
+
+        Returns:
+            Path: Absolute path to the config file.
+        """
+        return self._config_paths[config_name]
 
 
 class ConfigManager(ABC):
@@ -50,47 +153,80 @@ class ConfigManager(ABC):
     Attributes:
         base_config (BaseConfig): Base configuration containing environment settings.
 
-    Subclasses must implement the following methods:
-    - `_load_all_configs()`: Defines loading logic for speciality 
-                             configs.
+    Subclasses expose their speciality configs as
+    `functools.cached_property` attributes, so each `TOML` file is only
+    loaded when its config is first accessed.
 
     Subclasses do not implement the following methods:
-    - `__init__()`: Creates config path, loads in base config, and calls 
-                    abstract methods `_setup_paths()` and 
-                    `_load_all_configs()`.
+    - `__init__()`: Creates config path and loads in base config.
+    - `get()`: Returns a shared instance of the manager.
     - `_load_toml()`: Loads `TOML` file from file path.
+    - `clear_cache()`: Drops all cached `TOML` parses.
     """
 
+    # Shared managers, keyed by subclass and base config path
+    _instances: ClassVar[weakref.WeakValueDictionary] = weakref.WeakValueDictionary()
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
         """
         Initialize the configuration manager.
         """
 
-        self.base_config_path = Path(os.getenv('BASE_PATH')) \
-                              / os.getenv('BASE_CONFIG_PATH')
+        _ensure_env_loaded()
+        self.base_config_path = _BASE_CONFIG_PATH
         
         # Load Base Config
         base_data = self._load_toml(self.base_config_path)
-        self.base_config = BaseConfig(**base_data, **base_data['_config_paths'])
+        self.base_config = BaseConfig(**base_data)
 
-        # Call the abstract method that subclasses must implement
-        self._load_all_configs()
+        # Shallow field dict of the base config, used to build sub-configs
+        # without the recursive copying of `dataclasses.asdict`
+        self._base_config_kwargs = _shallow_asdict(self.base_config)
 
-    @abstractmethod
-    def _load_all_configs(self) -> None:
-        """Load all configuration objects specific to the subclass.
-        
-        This method should load all TOML files and create corresponding
-        configuration objects for the specific implementation.
+    @final
+    @classmethod
+    def get(cls) -> Self:
+        """
+        Get a shared instance of this configuration manager.
+
+        Instances are cached per subclass and base config path for as long
+        as a reference to them is held, so repeated calls (e.g. from worker
+        loops) reuse the already loaded configs instead of rebuilding them.
+
+        Returns:
+            Self: The shared configuration manager.
         """
-        ...
+        _ensure_env_loaded()
+        key = (cls, _BASE_CONFIG_PATH)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls()
+                cls._instances[key] = instance
+
+        return instance
 
     @final
-    def _load_toml(self, file_path: Path) -> dict:
-        """Load a TOML file and return its contents."""
-        if not file_path.exists():
-            return {}
+    def _load_toml(self, file_path: Path) -> MappingProxyType:
+        """
+        Load a TOML file and return its contents.
+
+        Parsed files are cached process-wide, keyed by path, modification
+        time and size. The cached dict is returned as a read-only view;
+        callers must build new dicts rather than mutate it.
+        """
+        path_str = os.fspath(file_path)
+        try:
+            stat = os.stat(path_str)
+        except FileNotFoundError:
+            return MappingProxyType({})
+
+        data = _load_toml_cached(path_str, stat.st_mtime_ns, stat.st_size)
+        return MappingProxyType(data)
 
-        with open(file_path, "rb") as f:
-            return tomllib.load(f)
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached TOML parses."""
+        _load_toml_cached.cache_clear()
         
\ No newline at end of file
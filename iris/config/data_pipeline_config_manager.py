@@ -2,17 +2,70 @@
 Configuration manager for data pipeline.
 """
 
-from dataclasses import dataclass, asdict, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import os
+import re
 
-from iris.config.config_manager import BaseConfig, ConfigManager
-from dotenv import load_dotenv
+from iris.config.config_manager import (
+    BaseConfig, 
+    ConfigManager, 
+    _ensure_env_loaded, 
+    _shallow_asdict
+)
 
-load_dotenv()
+# Credentials, read once on first use (see `_ensure_credentials_loaded()`)
+_MONGODB_CONNECTION_STRING: str | None = None
+_QDRANT_API_KEY: str | None = None
 
 
-@dataclass(frozen=True)
+def _reload_env() -> None:
+    """Re-read the credential environment variables."""
+    global _MONGODB_CONNECTION_STRING, _QDRANT_API_KEY
+
+    _MONGODB_CONNECTION_STRING = os.getenv('MONGODB_CONNECTION_STRING')
+    _QDRANT_API_KEY = os.getenv('QDRANT_API_KEY')
+
+
+@lru_cache(maxsize=1)
+def _ensure_credentials_loaded() -> bool:
+    """Load `.env` and read the credentials, once per process."""
+    _ensure_env_loaded()
+    _reload_env()
+    return True
+
+
+def _freeze(mapping: Mapping[str, str]) -> Mapping[str, str]:
+    """
+    Return a read-only view of a config mapping, without copying it.
+
+    Nested tables of parsed TOML files are shared through the parse cache, 
+    so configs expose them read-only rather than as mutable dicts.
+    """
+    if isinstance(mapping, MappingProxyType):
+        return mapping
+    return MappingProxyType(mapping)
+
+
+# Default URL patterns, shared read-only by all scraper configs
+_DEFAULT_PATTERNS = MappingProxyType({
+    "product": "/products/.+",
+    "collection": "/collections/.+",
+    "pagination": "/page/\\d+"
+})
+
+# QdrantConfig fields holding collection names, expanded from the template
+_QDRANT_COLLECTION_FIELDS = (
+    'product_collection',
+    'image_collection',
+    'localization_collection'
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ScraperConfig:  # TODO: Should this be an abstract class?
     """Base scraper configuration."""
 
@@ -21,30 +74,43 @@ class ScraperConfig:  # TODO: Should this be an abstract class?
     max_retries: int = 3
     timeout: int = 30
     wait_for_selector: str = "img"
-    patterns: dict[str, str] = field(default_factory=lambda: {
-        "product": "/products/.+",
-        "collection": "/collections/.+",
-        "pagination": "/page/\\d+"
-    })
+    block_assets: bool = False  # Skip image, font and stylesheet downloads
+    chromedriver_path: str | None = None  # Resolved by webdriver_manager if None
+    driver_pool_size: int = 4  # Idle WebDrivers kept for reuse after `close()`
+    patterns: Mapping[str, str] = field(default_factory=lambda: _DEFAULT_PATTERNS)
+    compiled_patterns: Mapping[str, re.Pattern] = field(
+        init=False, repr=False, compare=False
+    )  # Set in __post_init__ from `patterns`
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "patterns", _freeze(self.patterns))
+
+        # Compile the URL patterns once, rather than on every URL tested
+        object.__setattr__(self, "compiled_patterns", MappingProxyType({
+            name: re.compile(pattern) for name, pattern in self.patterns.items()
+        }))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShopConfig:
     """Shop-specific configuration."""
 
     shop_name: str
     base_url: str
-    image_selectors: dict[str, str]
-    metadata_selectors: dict[str, str]
+    image_selectors: Mapping[str, str]
+    metadata_selectors: Mapping[str, str]
     scraper_config: ScraperConfig
     start_url: str | None = None
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "image_selectors", _freeze(self.image_selectors))
+        object.__setattr__(self, "metadata_selectors", _freeze(self.metadata_selectors))
+
         if self.start_url is None:
             # Default to the base URL if no start URL is provided
             object.__setattr__(self, "start_url", self.base_url)
 
-@dataclass(frozen=True, kw_only=True)  # kw_only=True due to inheritance of BaseConfig
+@dataclass(frozen=True, kw_only=True, slots=True)  # kw_only=True due to inheritance of BaseConfig
 class ImageStoreConfig(BaseConfig):
     """Storage configuration."""
 
@@ -53,12 +119,12 @@ class ImageStoreConfig(BaseConfig):
     _path_template: str = "data/{env}/{shop_name}/images/"
     cache_enabled: bool = True
     timeout: int = 10
+    fast_jpeg_encoding: bool = True
     _shop_name: str
 
     def __post_init__(self) -> None:
-        computed_path = self._path_template.format(
-            env=self.environment,
-            shop_name=self._shop_name
+        computed_path = self._path_template.format_map(
+            {"env": self.environment, "shop_name": self._shop_name}
         )
 
         if self.storage_backend == 'local':
@@ -67,7 +133,7 @@ class ImageStoreConfig(BaseConfig):
             object.__setattr__(self, "storage_path", Path(computed_path))
 
 
-@dataclass(frozen=True, kw_only=True)  # kw_only=True due to inheritance of BaseConfig
+@dataclass(frozen=True, kw_only=True, slots=True)  # kw_only=True due to inheritance of BaseConfig
 class MongoDBConfig(BaseConfig):
     """MongoDB configuration."""
 
@@ -79,20 +145,31 @@ class MongoDBConfig(BaseConfig):
     image_metadata_collection: str = "image_metadata"
     localization_collection: str = "localizations"
     scraping_progress_collection: str = "scraping_progress"
+    # Fields to index, keyed by collection setting
+    indexes: Mapping[str, list[str]] = field(default_factory=dict)
+    create_indexes_on_connect: bool = True
     _shop_name: str
 
     def __post_init__(self) -> None:
-        database_name = self._database_template.format(
-            env=self.environment,
-            shop_name=self._shop_name
+        database_name = self._database_template.format_map(
+            {"env": self.environment, "shop_name": self._shop_name}
         )
         object.__setattr__(self, "database_name", database_name)
 
-        connection_string = os.getenv('MONGODB_CONNECTION_STRING')
-        object.__setattr__(self, "connection_string", connection_string)
+        _ensure_credentials_loaded()
+        object.__setattr__(self, "connection_string", _MONGODB_CONNECTION_STRING)
+
+        for collection_key in self.indexes:
+            if not (
+                collection_key.endswith("_collection") 
+                and isinstance(getattr(self, collection_key, None), str)
+            ):
+                raise ValueError(
+                    f"Unknown collection setting in MongoDB indexes: {collection_key}"
+                )
 
 
-@dataclass(frozen=True, kw_only=True)  # kw_only=True due to inheritance of BaseConfig
+@dataclass(frozen=True, kw_only=True, slots=True)  # kw_only=True due to inheritance of BaseConfig
 class QdrantConfig(BaseConfig):
     """Qdrant configuration."""
 
@@ -107,23 +184,22 @@ class QdrantConfig(BaseConfig):
 
 
     def __post_init__(self) -> None:
-        collections = [
-            'product_collection',
-            'image_collection', 
-            'localization_collection'
-        ]
-        for collection_attr in collections:
-            base_name = getattr(self, collection_attr)
-            full_collection = self._collection_template.format(
-                env=self.environment,
-                shop_name=self._shop_name,
-                collection_name=base_name
-            )
+        template = self._collection_template
+        env, shop_name = self.environment, self._shop_name
+        full_collections = {
+            collection_attr: template.format_map({
+                "env": env,
+                "shop_name": shop_name,
+                "collection_name": getattr(self, collection_attr)
+            })
+            for collection_attr in _QDRANT_COLLECTION_FIELDS
+        }
+        for collection_attr, full_collection in full_collections.items():
             object.__setattr__(self, collection_attr, full_collection)
 
 
-        api_key = os.getenv('QDRANT_API_KEY')
-        object.__setattr__(self, "api_key", api_key)
+        _ensure_credentials_loaded()
+        object.__setattr__(self, "api_key", _QDRANT_API_KEY)
 
         
 
@@ -139,6 +215,8 @@ class DataPipelineConfigManager(ConfigManager):
     - Storage settings (base paths, templates)
     - MongoDB connection settings
 
+    Each configuration is loaded from its TOML file on first access.
+
     Attributes:
         scraper_config (ScraperConfig): Base scraper configuration.
         shop_config (ShopConfig): Shop-specific configuration.
@@ -146,63 +224,79 @@ class DataPipelineConfigManager(ConfigManager):
         mongodb_config (MongoDBConfig): MongoDB configuration.
     """
 
-    def _load_all_configs(self) -> None:
-        # Load Scraper Config
-        scraper_data = self._load_toml(self.base_config.scraper_config_path)
-        self.scraper_config: ScraperConfig = self._create_scraper_config(scraper_data)
+    @cached_property
+    def scraper_config(self) -> ScraperConfig:
+        scraper_data = self._load_toml(self.base_config.path("scraper_config_path"))
+        return self._create_scraper_config(scraper_data)
+
+    @cached_property
+    def _scraper_config_kwargs(self) -> dict:
+        return _shallow_asdict(self.scraper_config)
 
-        # Load shop configurations
-        shop_config_data = self._load_toml(self.base_config.shop_config_path)
-        self.shop_config: ShopConfig = self._create_shop_config(shop_config_data)
+    @cached_property
+    def shop_config(self) -> ShopConfig:
+        shop_config_data = self._load_toml(self.base_config.path("shop_config_path"))
+        return self._create_shop_config(shop_config_data)
 
-        # Load Image Store Config
-        image_store_data = self._load_toml(self.base_config.image_store_config_path)
-        self.image_store_config: ImageStoreConfig = self._create_image_store_config(
+    @cached_property
+    def image_store_config(self) -> ImageStoreConfig:
+        image_store_data = self._load_toml(self.base_config.path("image_store_config_path"))
+        return self._create_image_store_config(
             image_store_data,
             self.shop_config.shop_name
         )
 
-        # Load MongoDB Config
-        mongodb_data = self._load_toml(self.base_config.mongodb_config_path)
-        self.mongodb_config: MongoDBConfig = self._create_mongodb_config(
+    @cached_property
+    def mongodb_config(self) -> MongoDBConfig:
+        mongodb_data = self._load_toml(self.base_config.path("mongodb_config_path"))
+        return self._create_mongodb_config(
             mongodb_data,
             self.shop_config.shop_name
         )
 
-        # Load Qdrant Config
-        qdrant_data = self._load_toml(self.base_config.qdrant_config_path)
-        self.qdrant_config: QdrantConfig = self._create_qdrant_config(
+    @cached_property
+    def qdrant_config(self) -> QdrantConfig:
+        qdrant_data = self._load_toml(self.base_config.path("qdrant_config_path"))
+        return self._create_qdrant_config(
             qdrant_data,
             self.shop_config.shop_name
         )
 
     def _create_scraper_config(
-        self, data: dict, 
-        override_data: dict | None = None
+        self, data: Mapping, 
+        override_data: Mapping | None = None
     ) -> ScraperConfig:
-        # Merge the default config data with any overrides
-        if override_data:
-            data.update(override_data)
+        if not override_data:
+            return ScraperConfig(**data)
+
+        # Merge the default config data with any overrides, without mutating 
+        # either input
+        merged = {**data, **override_data}
 
         # Make ScraperConfig
-        return ScraperConfig(**data)
-
-    def _create_shop_config(self, data: dict) -> ShopConfig:
-        # Merge the default scraper config with any shop-specific overrides
-        scraper_overrides = data.pop("scraper_overrides", {})
-        scraper_config = self._create_scraper_config(
-            asdict(self.scraper_config), 
-            scraper_overrides
-        )
+        return ScraperConfig(**merged)
+
+    def _create_shop_config(self, data: Mapping) -> ShopConfig:
+        # Merge the default scraper config with any shop-specific overrides.
+        # ScraperConfig is frozen, so shops without overrides share it as is.
+        scraper_overrides = data.get("scraper_overrides")
+        shop_data = {k: v for k, v in data.items() if k != "scraper_overrides"}
+        if scraper_overrides:
+            scraper_config = self._create_scraper_config(
+                self._scraper_config_kwargs, 
+                scraper_overrides
+            )
+        else:
+            scraper_config = self.scraper_config
 
         # Make ShopConfig
-        return ShopConfig(**data, scraper_config=scraper_config)
+        return ShopConfig(**shop_data, scraper_config=scraper_config)
     
-    def _create_image_store_config(self, data: dict, shop_name: str) -> ImageStoreConfig:
-        return ImageStoreConfig(**asdict(self.base_config), **data, _shop_name=shop_name)
+    def _create_image_store_config(self, data: Mapping, shop_name: str) -> ImageStoreConfig:
+        return ImageStoreConfig(**self._base_config_kwargs, **data, _shop_name=shop_name)
 
-    def _create_mongodb_config(self, data: dict, shop_name: str) -> MongoDBConfig:
-        return MongoDBConfig(**asdict(self.base_config), **data, _shop_name=shop_name)
+    def _create_mongodb_config(self, data: Mapping, shop_name: str) -> MongoDBConfig:
+        return MongoDBConfig(**self._base_config_kwargs, **data, _shop_name=shop_name)
 
-    def _create_qdrant_config(self, data: dict, shop_name: str) -> QdrantConfig:
-        return QdrantConfig(**asdict(self.base_config), **data, _shop_name=shop_name)
+    def _create_qdrant_config(self, data: Mapping, shop_name: str) -> QdrantConfig:
+        return QdrantConfig(**self._base_config_kwargs, **data, _shop_name=shop_name)
@@ -2,12 +2,13 @@
 Configuration manager for embedding pipeline.
 """
 
-from dataclasses import dataclass, asdict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
 
 from iris.config.config_manager import BaseConfig, ConfigManager
-from iris.config.data_pipeline_config_manager import ShopConfig
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ClipConfig(BaseConfig):
     """Configuration for CLIP model."""
     model_name: str
@@ -20,17 +21,15 @@ class EmbeddingPipelineConfigManager(ConfigManager):
     Handles loading and managing configurations for CLIP model and embedding database.
     
     Attributes:
-        embedding_config_dir (Path): Directory containing embedding pipeline configs
         clip_config (ClipConfig): Configuration for CLIP model
         database_config (EmbeddingDBConfig): Configuration for embedding database
     """
 
-    def _load_all_configs(self) -> None:     
-        # Load Clip Config   
-        clip_data = self._load_toml(self.base_config.clip_config_path)
-        self.clip_config = self._create_clip_config(clip_data)
-        
+    @cached_property
+    def clip_config(self) -> ClipConfig:
+        clip_data = self._load_toml(self.base_config.path("clip_config_path"))
+        return self._create_clip_config(clip_data)
 
-    def _create_clip_config(self, data: dict) -> ClipConfig:
-        return ClipConfig(**asdict(self.base_config), **data)
+    def _create_clip_config(self, data: Mapping) -> ClipConfig:
+        return ClipConfig(**self._base_config_kwargs, **data)
     
\ No newline at end of file
@@ -2,15 +2,17 @@
 Configuration manager for object localization pipeline.
 """
 
+from collections.abc import Mapping
 from typing import Union
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from functools import cached_property
 from abc import ABC
 from pathlib import Path
 
 from iris.config.config_manager import BaseConfig, ConfigManager
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LocalizationModelConfig(ABC, BaseConfig):
     """Base configuration for localization models."""
 
@@ -28,18 +30,18 @@ class LocalizationModelConfig(ABC, BaseConfig):
             self.base_path / self.checkpoint_path
         )
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class YoloConfig(LocalizationModelConfig):
     """Configuration for YOLO model."""
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class YolosConfig(LocalizationModelConfig):
     """Configuration for YOLOS model."""
 
     use_fast: bool = True
     confidence_threshold: float = 0.5
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SAM2Config(LocalizationModelConfig):
     """Configuration for SAM2 mask generation."""
     
@@ -47,6 +49,14 @@ class SAM2Config(LocalizationModelConfig):
     mask_format: str = "binary"
 
 
+# Model config class for each supported `model_type` in localization.toml
+_MODEL_CONFIG_TYPES: dict[str, type[LocalizationModelConfig]] = {
+    "yolo": YoloConfig,
+    "yolos": YolosConfig,
+    "sam2": SAM2Config,
+}
+
+
 class LocalizationPipelineConfigManager(ConfigManager):
     """
     Manages configuration loading and access for the object localization 
@@ -61,27 +71,22 @@ class LocalizationPipelineConfigManager(ConfigManager):
                                                       configuration.
     """
 
-    def _load_all_configs(self) -> None:
+    @cached_property
+    def _localization_base_config(self) -> Mapping:
         # Load main object localization config
-        self._localization_base_config = self._load_toml(
-            self.base_config.localization_config_path
-        )
+        return self._load_toml(self.base_config.path("localization_config_path"))
 
-        # Load model config
+    @cached_property
+    def model_config(self) -> LocalizationModelConfig:
         model_data = self._load_toml(
             self.base_config.config_dir / self._localization_base_config["model_config"]
         )
-        self.model_config = self._create_model_config(model_data)
-
-    def _create_model_config(self, data: dict) -> LocalizationModelConfig:
-        match self._localization_base_config['model_type']:
-            case 'yolo':
-                return YoloConfig(**asdict(self.base_config), **data)
-            case 'yolos':
-                return YolosConfig(**asdict(self.base_config), **data)
-            case 'sam2':
-                return SAM2Config(**asdict(self.base_config), **data)
-            case _:
-                raise ValueError(
-                    f"Unsupported model type: {self._localization_base_config['model_type']}"
-                )
+        return self._create_model_config(model_data)
+
+    def _create_model_config(self, data: Mapping) -> LocalizationModelConfig:
+        model_type = self._localization_base_config['model_type']
+        model_config_cls = _MODEL_CONFIG_TYPES.get(model_type)
+        if model_config_cls is None:
+            raise ValueError(f"Unsupported model type: {model_type}")
+
+        return model_config_cls(**self._base_config_kwargs, **data)
@@ -1,7 +1,11 @@
 from pathlib import Path
-from typing import Dict
-import time
+from typing import ClassVar, Dict, Self
+import atexit
+import functools
+import queue
+import threading
 
+import soupsieve as sv
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -18,6 +22,62 @@ from selenium.common.exceptions import (SessionNotCreatedException,
 from iris.config.data_pipeline_config_manager import ScraperConfig
 from iris.utils.log import logger
 
+# Extracts the text of the first match of each selector in `arguments[0]` in 
+# a single round trip, see `BaseScraper.extract_data()`
+_EXTRACT_DATA_SCRIPT = """
+    const data = {};
+    for (const [key, selector] of Object.entries(arguments[0])) {
+        const element = document.querySelector(selector);
+        data[key] = element ? element.textContent.trim() : "NOT_FOUND";
+    }
+    return data;
+"""
+
+# Seconds to wait for lazily loaded content to grow the page after a scroll
+_SCROLL_WAIT_TIMEOUT = 1
+
+# Asset URLs not needed to scrape a page, blocked when `block_assets` is set.
+# Images are still found through their `src` attributes in the HTML.
+_BLOCKED_ASSET_URLS = ["*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", 
+                       "*.woff", "*.woff2", "*.ttf", "*.css"]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_selectors(
+    selectors: tuple[tuple[str, str], ...]
+) -> tuple[sv.SoupSieve, tuple[tuple[str, sv.SoupSieve], ...]]:
+    """
+    Compile a set of data selectors, once per distinct set.
+
+    Args:
+        selectors (tuple[tuple[str, str], ...]): Pairs of data key and CSS 
+                                                 selector.
+
+    Returns:
+        tuple[SoupSieve, tuple[tuple[str, SoupSieve], ...]]: All selectors 
+            combined into one, and each key paired with its own selector.
+    """
+    combined = sv.compile(", ".join(selector for _, selector in selectors))
+    compiled = tuple((key, sv.compile(selector)) for key, selector in selectors)
+    return combined, compiled
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_chromedriver() -> str:
+    """
+    Resolve the path of the ChromeDriver executable, once per process.
+
+    `ChromeDriverManager().install()` queries the network for the driver 
+    version on every call, so the result is cached and shared by all 
+    scrapers.
+
+    Returns:
+        str: Path to the ChromeDriver executable.
+    """
+    driver_path = ChromeDriverManager().install()
+    logger.debug(f"Using ChromeDriver at {driver_path}")
+    return driver_path
+
 
 class BaseScraper:
     """
@@ -25,17 +85,75 @@ class BaseScraper:
 
     Features:
     - Selenium WebDriver setup and management
+    - Optional WebDriver reuse, by releasing scrapers with `close()` or a 
+      `with` block
     - Page loading with wait conditions
     - Basic HTML parsing with BeautifulSoup
     """
 
-    def __init__(self, scraper_config: ScraperConfig) -> None:
+    # Idle WebDrivers, shared by all scrapers. Every driver is launched with 
+    # the same Chrome options, so a single pool covers all of them. Drivers 
+    # only enter the pool through an explicit `close()`, and the pool is 
+    # created then, sized by that scraper's config.
+    _driver_pool: ClassVar[queue.Queue[WebDriver] | None] = None
+    _driver_pool_lock: ClassVar[threading.Lock] = threading.Lock()
+    _pool_closed: ClassVar[bool] = False
+
+    def __init__(
+        self, 
+        scraper_config: ScraperConfig, 
+        driver: WebDriver | None = None
+    ) -> None:
         """
         Initialize the BaseScraper with a configured Selenium WebDriver.
+
+        Unless a driver is given, a healthy idle driver from the shared pool 
+        is reused when available, otherwise a new one is started.
+
+        Args:
+            scraper_config (ScraperConfig): Scraper configuration.
+            driver (WebDriver | None): Externally managed driver to use. It 
+                                       is neither pooled nor quit by the 
+                                       scraper.
         """
         self.scraper_config = scraper_config
+        self._owns_driver = driver is None
 
-        # Set up Selenium WebDriver
+        if driver is not None:
+            self.driver: WebDriver = driver
+        else:
+            self.driver = (
+                self._checkout_driver() 
+                or self._create_driver(self.scraper_config.chromedriver_path)
+            )
+
+        if self.scraper_config.block_assets:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": _BLOCKED_ASSET_URLS}
+            )
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit, see `close()`."""
+        self.close()
+
+    @staticmethod
+    def _create_driver(chromedriver_path: str | None = None) -> WebDriver:
+        """
+        Start a new Selenium WebDriver.
+
+        Args:
+            chromedriver_path (str | None): ChromeDriver executable to use. 
+                                            If None, it is resolved with 
+                                            `webdriver_manager`.
+
+        Returns:
+            WebDriver: Headless Chrome driver.
+        """
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -54,11 +172,11 @@ class BaseScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
 
-        service = Service(ChromeDriverManager().install())
-        self.driver: WebDriver = webdriver.Chrome(service=service, options=chrome_options)
+        service = Service(chromedriver_path or _resolve_chromedriver())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
         
         # Execute CDP commands to prevent detection
-        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
             "source": """
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined
@@ -66,12 +184,137 @@ class BaseScraper:
             """
         })
 
+        return driver
+
+    @classmethod
+    def _checkout_driver(cls) -> WebDriver | None:
+        """
+        Take a responsive driver from the shared pool.
+
+        Drivers whose browser stopped responding while idle are quit.
+
+        Returns:
+            WebDriver | None: An idle driver, or None if none is available.
+        """
+        if cls._driver_pool is None:
+            return None
+        while True:
+            try:
+                driver = cls._driver_pool.get_nowait()
+            except queue.Empty:
+                return None
+            try:
+                driver.execute_script("return 1")
+                return driver
+            except WebDriverException:
+                logger.debug("Discarding unresponsive pooled WebDriver.")
+                cls._quit_driver(driver)
+
+    def _get_driver_pool(self) -> queue.Queue[WebDriver]:
+        """
+        Get the shared pool, creating it with this scraper's configured size.
+        """
+        with self._driver_pool_lock:
+            if BaseScraper._driver_pool is None:
+                BaseScraper._driver_pool = queue.Queue(
+                    maxsize=self.scraper_config.driver_pool_size
+                )
+        return BaseScraper._driver_pool
+
+    @staticmethod
+    def _reset_driver(driver: WebDriver) -> None:
+        """
+        Clear the browser state a scraper leaves behind, before pooling.
+
+        Lifts asset blocking and clears cookies, cache and the storage of 
+        the loaded page's origin, then leaves the page.
+        """
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        origin = driver.execute_script("return window.location.origin")
+        if origin and origin != "null":
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin", 
+                {"origin": origin, "storageTypes": "all"}
+            )
+        driver.get("about:blank")
+
+    @staticmethod
+    def _quit_driver(driver: WebDriver) -> None:
+        """Quit a driver, ignoring an already crashed browser."""
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """
+        Quit all idle WebDrivers in the shared pool.
+
+        Called at interpreter exit, after which closed scrapers quit their 
+        drivers instead of pooling them. Can also be called directly, e.g. 
+        to free idle browsers in a long-running notebook kernel.
+        """
+        if cls._driver_pool is None:
+            return
+        while True:
+            try:
+                driver = cls._driver_pool.get_nowait()
+            except queue.Empty:
+                return
+            cls._quit_driver(driver)
+
+    @classmethod
+    def _shutdown_pool(cls) -> None:
+        cls._pool_closed = True
+        cls.close_pool()
+
+    def close(self) -> None:
+        """
+        Release the WebDriver, returning it to the shared pool for reuse.
+
+        The browser state is reset first. If the pool is full or shut down, 
+        or the reset fails, the driver is quit instead. Externally managed 
+        drivers are left running.
+        """
+        driver = self.__dict__.pop("driver", None)
+        if driver is None:
+            return
+        if not self._owns_driver:
+            self._release_external_driver(driver)
+            return
+
+        if not self._pool_closed:
+            try:
+                self._reset_driver(driver)
+                self._get_driver_pool().put_nowait(driver)
+                return
+            except (queue.Full, WebDriverException):
+                pass
+        self._quit_driver(driver)
+
     def __del__(self):
         """
-        Cleanup: Close the WebDriver when the object is destroyed.
+        Cleanup: Quit the WebDriver when the object is destroyed, unless it 
+        was released with `close()` or is externally managed.
         """
-        if hasattr(self, "driver"):
-            self.driver.quit()
+        driver = self.__dict__.get("driver")
+        if driver is None:
+            return
+        if self._owns_driver:
+            self._quit_driver(driver)
+        else:
+            self._release_external_driver(driver)
+
+    def _release_external_driver(self, driver: WebDriver) -> None:
+        """Lift this scraper's asset blocking from an externally managed driver."""
+        if self.scraper_config.block_assets:
+            try:
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+            except WebDriverException:
+                pass
 
     def load_page(self, url: str) -> BeautifulSoup | None:
         """
@@ -99,10 +342,7 @@ class BaseScraper:
             # Scroll to load all images
             self._scroll_to_load_images()
             
-            # Wait additional time for dynamic content
-            self.driver.implicitly_wait(2)
-            
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            return BeautifulSoup(self.driver.page_source, "lxml")
         except TimeoutException:
             logger.warning(f"Timeout waiting for element on page: {url}")
         except WebDriverException as e:
@@ -120,33 +360,65 @@ class BaseScraper:
             # Scroll to bottom
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             
-            # Wait for potential new content
-            time.sleep(1)
-            
-            # Calculate new scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            # Break if no more new content
-            if new_height == last_height:
+            # Wait until new content grows the page, for at most one second
+            try:
+                new_height = WebDriverWait(
+                    self.driver, _SCROLL_WAIT_TIMEOUT, poll_frequency=0.1
+                ).until(lambda driver: self._grown_height(driver, last_height))
+            except TimeoutException:
+                # Break if no more new content
                 break
                 
             last_height = new_height
 
+    @staticmethod
+    def _grown_height(driver: WebDriver, last_height: int) -> int | bool:
+        """
+        Return the page's scroll height if it changed, otherwise False.
+        """
+        height = driver.execute_script("return document.body.scrollHeight")
+        return height if height != last_height else False
+
     def extract_data(
-        self, soup: BeautifulSoup, selectors: Dict[str, str]
+        self, soup: BeautifulSoup | None, selectors: Dict[str, str]
     ) -> Dict[str, str]:
         """
         Extracts data from the given BeautifulSoup object using provided CSS selectors.
 
+        If `soup` is None, the selectors are instead evaluated in the browser 
+        on the page currently loaded by this scraper's driver, which avoids 
+        transferring and parsing the page source.
+
         Args:
-            soup (BeautifulSoup): Parsed HTML page.
+            soup (BeautifulSoup | None): Parsed HTML page, or None to query 
+                                         the loaded page in the browser.
             selectors (Dict[str, str]): Dictionary mapping data keys to CSS selectors.
 
         Returns:
             Dict[str, str]: Extracted data with values from matching elements.
         """
+        if not selectors:
+            return {}
+
+        if soup is None:
+            return self.driver.execute_script(_EXTRACT_DATA_SCRIPT, dict(selectors))
+
+        # Walk the DOM once with all selectors combined, lazily, so the walk 
+        # stops once every key has matched. Matches come in document order, 
+        # so the first match of each selector is the same element 
+        # `select_one` would have returned.
+        combined, compiled = _compile_selectors(tuple(selectors.items()))
         data = {}
-        for key, selector in selectors.items():
-            element = soup.select_one(selector)
-            data[key] = element.text.strip() if element else "NOT_FOUND"
-        return data
+        remaining = dict(compiled)
+        for element in combined.iselect(soup):
+            for key, selector in list(remaining.items()):
+                if selector.match(element):
+                    data[key] = element.text.strip()
+                    del remaining[key]
+            if not remaining:
+                break
+
+        return {key: data.get(key, "NOT_FOUND") for key in selectors}
+
+
+atexit.register(BaseScraper._shutdown_pool)
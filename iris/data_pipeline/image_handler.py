@@ -1,48 +1,82 @@
 from abc import ABC
+from functools import lru_cache
+import soupsieve as sv
 from bs4 import BeautifulSoup
 
 from iris.models.image import Image
 from iris.utils.utils import normalize_image_url
 
 
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> sv.SoupSieve:
+    """Compile a CSS selector, once per distinct selector string."""
+    return sv.compile(selector)
+
+
 class ImageHandler(ABC):
     """
     A collection of image scraping operations.
     """
 
     @classmethod
-    def _get_element_path(cls, element: BeautifulSoup) -> str:
+    def _get_element_path(
+        cls, 
+        element: BeautifulSoup, 
+        path_cache: dict[int, str] | None = None
+    ) -> str:
         """
         Get the full path from root to the element, including classes and IDs.
 
         Args:
             element (BeautifulSoup): The element to get the path for.
+            path_cache (dict[int, str] | None): Paths of already visited 
+                                                elements, keyed by `id()`. 
+                                                Sibling images then only 
+                                                walk up to their shared 
+                                                container.
 
         Returns:
             str: The full path from root to the element.
         """
-        # Get all parents including the element itself
-        path = [element] + list(element.find_parents())
+        if path_cache is None:
+            path_cache = {}
+
+        # Walk up until the root or the first ancestor with a known path
+        uncached = []
+        path = ""
+        elem = element
+        while elem is not None:
+            if (cached := path_cache.get(id(elem))) is not None:
+                path = cached
+                break
+            uncached.append(elem)
+            elem = elem.parent
         
-        # Build identifiers for each element in the path
-        identifiers = []
-        for elem in reversed(path):  # Reverse to get root-to-element order
+        # Extend the path down to the element, caching it for each ancestor
+        for elem in reversed(uncached):  # Reverse to get root-to-element order
             if identifier := elem.name:
                 if classes := elem.get("class"):
-                    identifier += f".{' .'.join(classes)}"
+                    identifier += f".{'.'.join(classes)}"
                 if elem_id := elem.get("id"):
                     identifier += f"#{elem_id}"
-                identifiers.append(identifier)
+                path = f"{path} > {identifier}" if path else identifier
+            path_cache[id(elem)] = path
         
-        return " > ".join(identifiers)
+        return path
 
     @classmethod
-    def _get_image_data(cls, img_element: BeautifulSoup) -> tuple[str, str] | None:
+    def _get_image_data(
+        cls, 
+        img_element: BeautifulSoup, 
+        path_cache: dict[int, str] | None = None
+    ) -> tuple[str, str] | None:
         """
         Extract the image source URL and its DOM location from a single <img> element.
 
         Args:
             img_element (BeautifulSoup): A single <img> tag parsed from the page.
+            path_cache (dict[int, str] | None): Shared DOM path cache, see 
+                                                `_get_element_path()`.
 
         Returns:
             tuple[str, str] | None: A tuple containing the normalized image URL and a DOM location
@@ -54,7 +88,7 @@ class ImageHandler(ABC):
             
         # Normalize the URL to remove query parameters
         normalized_src = normalize_image_url(src)
-        dom_location = cls._get_element_path(img_element)
+        dom_location = cls._get_element_path(img_element, path_cache)
 
         return (normalized_src, dom_location)
 
@@ -69,7 +103,8 @@ class ImageHandler(ABC):
 
         This method uses the given CSS selector to locate image elements or their containers,
         then finds all <img> tags and extracts their "src" URLs along with a description
-        of where they appear in the document structure.
+        of where they appear in the document structure. Each normalized URL is returned
+        once, with the location where it first appears.
 
         Args:
             soup (BeautifulSoup): Parsed HTML document.
@@ -81,20 +116,25 @@ class ImageHandler(ABC):
     """
         image_urls = []
         dom_locations = []
-        elements = soup.select(image_selector)
+        seen_urls: set[str] = set()
+        path_cache: dict[int, str] = {}
+        elements = _compile_selector(image_selector).select(soup)
 
         for element in elements:
             if element.name == "img":
                 # Directly an <img>, extract data
-                if data := cls._get_image_data(element):
-                    image_urls.append(data[0])
-                    dom_locations.append(data[1])
+                imgs = [element]
             else:
                 # It's a container (e.g., <div>), find all <img> inside
-                for img in element.find_all("img"):
-                    if data := cls._get_image_data(img):
-                        image_urls.append(data[0])
-                        dom_locations.append(data[1])
+                imgs = element.find_all("img")
+
+            for img in imgs:
+                # Keep only the first occurrence of each image URL
+                data = cls._get_image_data(img, path_cache)
+                if data and data[0] not in seen_urls:
+                    seen_urls.add(data[0])
+                    image_urls.append(data[0])
+                    dom_locations.append(data[1])
 
         return image_urls, dom_locations
 
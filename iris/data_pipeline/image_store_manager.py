@@ -1,6 +1,13 @@
 import os
 import io
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 from PIL import Image as PILImage
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -8,6 +15,31 @@ from pathlib import Path
 from iris.config.data_pipeline_config_manager import ImageStoreConfig
 from iris.utils.log import logger
 
+# Prefer the libjpeg-turbo based `simplejpeg` encoder when installed
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+# Quality of JPEGs encoded by `simplejpeg`, matching Pillow's default
+_JPEG_QUALITY = 75
+
+
+def _run_sync(coroutine):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Inside an already running event loop (e.g. a Jupyter notebook), the 
+    coroutine is run on a new loop in a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
 
 class ImageStoreManager:
     """
@@ -17,11 +49,16 @@ class ImageStoreManager:
 
     def __init__(self, config: ImageStoreConfig):
         self.config = config
+        self._session: requests.Session | None = None  # Created on first use
+        self._session_pid: int | None = None
 
         match self.config.storage_backend:
             case "local":
                 logger.debug("Using local storage backend.")
-                self.storage_backend = LocalStorageHandler(self.config.storage_path)
+                self.storage_backend = LocalStorageHandler(
+                    self.config.storage_path,
+                    fast_jpeg_encoding=self.config.fast_jpeg_encoding
+                )
             case _:
                 logger.error(f"Unsupported storage backend: {self.config.storage_backend}")
                 raise ValueError(f"Unsupported storage backend: {self.config.storage_backend}")
@@ -32,6 +69,7 @@ class ImageStoreManager:
         image_id: str | None = None,
         path: Path | None = None, 
         url: str | None = None,
+        max_size: int | None = None,
     ) -> tuple[PILImage.Image, Path]:
         """
         Resolve image from id, storage path, or url.
@@ -45,6 +83,10 @@ class ImageStoreManager:
                                 key or similar.
             url (str | None): URL to download the image if id, and path is not 
                               provided.
+            max_size (int | None): Longest side the caller will scale the 
+                                   image down to. Stored images may then be 
+                                   decoded at a reduced size of at least 
+                                   this. None loads the full image.
 
         Returns:
             tuple[PIL.Image, Path]: The loaded image and storage location.
@@ -59,36 +101,209 @@ class ImageStoreManager:
         if image_id is not None:
             try:
                 logger.debug(f"Attempting to resolve image from id: {image_id}")
-                image = self.storage_backend.load_from_id(image_id)
-                path = self.storage_backend.path_from_id(image_id)
-                return image, path
+                id_path = self.storage_backend.path_from_id(image_id)
+                image = self.storage_backend.load_from_path(id_path, max_size)
+                return image, id_path
             except FileNotFoundError:
                 logger.warning(f"Image with ID {image_id} not found in storage.")
         if path is not None:
             try:
                 logger.debug(f"Attempting to resolve image from storage_location: {path}")
-                image = self.storage_backend.load_from_path(path)
+                image = self.storage_backend.load_from_path(path, max_size)
                 return image, path
             except FileNotFoundError:
                 logger.warning(f"Image not found at storage location: {path}")
         if (url is not None) and (image_id is not None):
             logger.debug(f"Falling back to downloading image from URL: {url}")
-            image = self._download(url)
-            path = self.storage_backend.save_to_id(image, image_id)
+            content, image = self._download(url)
+            path = self._store(content, image_id, image)
             return image, path
         
         logger.error("No storage location or URL and image ID provided for image resolution.")
         raise FileNotFoundError("No storage location or URL and image ID provided for image resolution.")
 
+    def __getstate__(self) -> dict:
+        # Sessions hold open sockets, so each process creates its own
+        state = self.__dict__.copy()
+        state["_session"] = None
+        state["_session_pid"] = None
+        return state
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session shared by all downloads of this manager.
+
+        Connections are kept alive and reused, since most images come from 
+        a few hosts. The session is created lazily, and again in forked or 
+        unpickled copies, so processes never share sockets.
+        """
+        if self._session is None or self._session_pid != os.getpid():
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+            self._session_pid = os.getpid()
+        return self._session
+
+    def get_pil_images(
+        self,
+        images: Iterable[tuple[str | None, Path | None, str | None]],
+        max_workers: int = 8
+    ) -> list[tuple[PILImage.Image, Path]]:
+        """
+        Resolve many images in parallel, see `get_pil_image()`.
+
+        Resolving is dominated by network and disk I/O, so images are 
+        resolved on a thread pool rather than one after another.
+
+        Args:
+            images (Iterable[tuple[str | None, Path | None, str | None]]): 
+                `(image_id, path, url)` triples, as passed to 
+                `get_pil_image()`.
+            max_workers (int): Maximum number of images resolved at once.
+
+        Returns:
+            list[tuple[PIL.Image, Path]]: The loaded images and storage 
+                                          locations, in input order.
+
+        Raises:
+            FileNotFoundError: If any image cannot be resolved from any source.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda args: self.get_pil_image(*args), images)
+            )
+
+    def prefetch(
+        self, 
+        images: Iterable[tuple[str, str]], 
+        max_concurrency: int = 32
+    ) -> dict[str, Path]:
+        """
+        Download and store many images concurrently.
+
+        Images are fetched with up to `max_concurrency` requests in flight, 
+        so later `get_pil_image()` calls resolve them from storage instead 
+        of downloading them one at a time. Images already in storage are 
+        skipped.
+
+        Args:
+            images (Iterable[tuple[str, str]]): Pairs of image ID and URL.
+            max_concurrency (int): Maximum number of simultaneous downloads.
+
+        Returns:
+            dict[str, Path]: Storage location of each successfully stored 
+                             image, keyed by image ID.
+        """
+        paths: dict[str, Path] = {}
+        missing: list[tuple[str, str]] = []
+        for image_id, url in images:
+            if self.storage_backend.has_id(image_id):
+                paths[image_id] = self.storage_backend.path_from_id(image_id)
+            else:
+                missing.append((image_id, url))
 
-    def _download(self, url: str) -> PILImage.Image:
+        stored = {}
+        if missing:
+            stored = _run_sync(self._prefetch(missing, max_concurrency))
+        logger.info(
+            f"Prefetched images: {len(stored)} downloaded, {len(paths)} "
+            f"already stored, {len(missing) - len(stored)} failed."
+        )
+
+        paths.update(stored)
+        return paths
+
+    async def _prefetch(
+        self, 
+        images: list[tuple[str, str]], 
+        max_concurrency: int
+    ) -> dict[str, Path]:
+        paths: dict[str, Path] = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        # Images come from a few CDN hosts, so each is resolved once per 
+        # prefetch
+        connector = aiohttp.TCPConnector(
+            limit=max_concurrency, ttl_dns_cache=600
+        )
+
+        async def fetch(
+            session: aiohttp.ClientSession, 
+            image_id: str, 
+            url: str
+        ) -> None:
+            async with semaphore:
+                try:
+                    logger.debug(f"Downloading image from URL: {url}")
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        content = await response.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error(
+                        f"Failed to download image from URL {url}: {e}"
+                    )
+                    return
+
+            # Decode and write off the event loop, so downloads keep flowing
+            # Any failure only skips this image, rather than cancelling the 
+            # other downloads in the task group
+            try:
+                paths[image_id] = await asyncio.to_thread(
+                    self._store, content, image_id
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to decode or store image from URL {url}: {e}"
+                )
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            async with asyncio.TaskGroup() as tg:
+                for image_id, url in images:
+                    tg.create_task(fetch(session, image_id, url))
+
+        return paths
+
+    def _store(
+        self, 
+        content: bytes, 
+        image_id: str, 
+        image: PILImage.Image | None = None
+    ) -> Path:
+        """
+        Store downloaded image bytes under an image ID.
+
+        Images are stored as JPEG, so JPEG downloads are written as is, 
+        skipping a decode and a lossy re-encode. Other formats are decoded, 
+        unless already decoded as `image`, and converted.
+        """
+        if PILImage.open(io.BytesIO(content)).format == "JPEG":  # Header only
+            return self.storage_backend.save_bytes_to_id(content, image_id)
+
+        if image is None:
+            image = self._decode(content)
+        return self.storage_backend.save_to_id(image, image_id)
+
+    @staticmethod
+    def _decode(content: bytes) -> PILImage.Image:
+        return PILImage.open(io.BytesIO(content)).convert("RGB")
+
+    def _download(self, url: str) -> tuple[bytes, PILImage.Image]:
         try:
             logger.debug(f"Downloading image from URL: {url}")
-            response = requests.get(url, timeout=self.config.timeout)
+            response = self.session.get(url, timeout=self.config.timeout)
             response.raise_for_status()
-            image = PILImage.open(io.BytesIO(response.content)).convert("RGB")
+            image = self._decode(response.content)
             logger.debug(f"Successfully downloaded image from URL: {url}")
-            return image
+            return response.content, image
         except (requests.RequestException, OSError) as e:
             logger.error(f"Failed to download or decode image from URL {url}: {e}")
             raise FileNotFoundError(f"Could not download image from URL: {url}")
@@ -101,37 +316,120 @@ class StorageBackendHandler(ABC):
         ...
 
     @abstractmethod
-    def load_from_path(self, path: Path) -> PILImage.Image:
+    def save_bytes_to_path(self, content: bytes, path: Path) -> Path:
+        ...
+
+    @abstractmethod
+    def load_from_path(
+        self, 
+        path: Path, 
+        max_size: int | None = None
+    ) -> PILImage.Image:
         ...
     
     @abstractmethod
     def path_from_id(self, image_id: str) -> Path:
         ...
 
+    @abstractmethod
+    def has_id(self, image_id: str) -> bool:
+        ...
+
     def save_to_id(self, image: PILImage.Image, image_id: str) -> Path:
         path = self.path_from_id(image_id)
         return self.save_to_path(image, path)
 
-    def load_from_id(self, image_id: str) -> PILImage.Image:
+    def save_bytes_to_id(self, content: bytes, image_id: str) -> Path:
         path = self.path_from_id(image_id)
-        return self.load_from_path(path)
+        return self.save_bytes_to_path(content, path)
+
+    def load_from_id(
+        self, 
+        image_id: str, 
+        max_size: int | None = None
+    ) -> PILImage.Image:
+        path = self.path_from_id(image_id)
+        return self.load_from_path(path, max_size)
 
 
 class LocalStorageHandler(StorageBackendHandler):
-    def __init__(self, directory: Path):
+    def __init__(self, directory: Path, fast_jpeg_encoding: bool = True):
         self.directory = directory
+        self.fast_jpeg_encoding = fast_jpeg_encoding and simplejpeg is not None
+        self._created_dirs: set[Path] = set()  # Directories known to exist
+        self._stored_ids: set[str] | None = None  # Listed on first `has_id()`
+        self._listed_mtime: int | None = None  # Directory mtime when listed
+        self._paths: dict[str, Path] = {}  # Resolved paths, keyed by image ID
 
     def path_from_id(self, image_id: str) -> Path:
-        return self.directory / f"{image_id}.jpg"
+        if (path := self._paths.get(image_id)) is None:
+            path = self._paths[image_id] = self.directory / f"{image_id}.jpg"
+        return path
+
+    def has_id(self, image_id: str) -> bool:
+        # Answer from a directory listing, listed again whenever files were 
+        # added or removed since, e.g. by another process
+        try:
+            mtime = os.stat(self.directory).st_mtime_ns
+            if self._stored_ids is None or mtime != self._listed_mtime:
+                with os.scandir(self.directory) as entries:
+                    self._stored_ids = {
+                        entry.name.removesuffix(".jpg") 
+                        for entry in entries if entry.name.endswith(".jpg")
+                    }
+                self._listed_mtime = mtime
+        except FileNotFoundError:
+            return False
+        return image_id in self._stored_ids
     
     def save_to_path(self, image: PILImage.Image, path: Path) -> Path:
-        os.makedirs(path.parent, exist_ok=True)
-        image.save(path)
+        self._ensure_parent(path)
+        if (
+            self.fast_jpeg_encoding 
+            and image.mode == "RGB" 
+            and path.suffix == ".jpg"
+        ):
+            path.write_bytes(
+                simplejpeg.encode_jpeg(
+                    np.asarray(image), quality=_JPEG_QUALITY, colorspace="RGB"
+                )
+            )
+        else:
+            image.save(path)
+        self._mark_stored(path)
+        logger.debug(f"Image saved at path: {path}")
+        return path
+
+    def save_bytes_to_path(self, content: bytes, path: Path) -> Path:
+        self._ensure_parent(path)
+        path.write_bytes(content)
+        self._mark_stored(path)
         logger.debug(f"Image saved at path: {path}")
         return path
 
-    def load_from_path(self, path: Path) -> PILImage.Image:
-        if not path.exists():
+    def _ensure_parent(self, path: Path) -> None:
+        if path.parent not in self._created_dirs:
+            os.makedirs(path.parent, exist_ok=True)
+            self._created_dirs.add(path.parent)
+
+    def _mark_stored(self, path: Path) -> None:
+        if self._stored_ids is not None and path.parent == self.directory:
+            self._stored_ids.add(path.stem)
+
+    def load_from_path(
+        self, 
+        path: Path, 
+        max_size: int | None = None
+    ) -> PILImage.Image:
+        # Open directly rather than checking existence first, saving a stat
+        # on every stored image
+        try:
+            image = PILImage.open(path)
+        except FileNotFoundError:
             logger.error(f"Image file not found at path: {path}")
-            raise FileNotFoundError(path)
-        return PILImage.open(path).convert("RGB")
\ No newline at end of file
+            raise
+        if max_size is not None:
+            # Let the JPEG decoder scale down by up to 8x while decoding, 
+            # keeping the longest side at least `max_size`
+            image.draft("RGB", (max_size, max_size))
+        return image.convert("RGB")
\ No newline at end of file
@@ -1,7 +1,11 @@
+import atexit
+import time
+import threading
+from datetime import datetime, timezone
 from typing import TypeAlias, Self
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.collection import Collection
 from pymongo.database import Database
 
@@ -12,6 +16,54 @@ from iris.models.factory import factory as document_factory
 # Type aliases
 DocumentType: TypeAlias = dict[str, any]
 QueryType: TypeAlias = dict[str, any]
+ProjectionType: TypeAlias = dict[str, int]
+
+# Maximum number of operations sent in a single bulk write
+_BULK_WRITE_BATCH_SIZE = 1000
+
+# Number of documents fetched per server round trip when iterating
+_FIND_BATCH_SIZE = 1000
+
+# Databases whose configured indexes were ensured by this process, keyed by 
+# connection string and database name
+_indexed_databases: set[tuple[str, str]] = set()
+
+# Clients shared by all managers, keyed by connection string and TLS setting.
+# Each client pools its own connections and runs monitoring threads.
+_clients: dict[tuple[str, bool], MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(
+    connection_string: str, 
+    tls_allow_invalid_certificates: bool
+) -> MongoClient:
+    """Get the shared client for a connection, creating it on first use."""
+    key = (connection_string, tls_allow_invalid_certificates)
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = MongoClient(
+                connection_string,
+                tlsAllowInvalidCertificates=tls_allow_invalid_certificates,
+            )
+        return _clients[key]
+
+
+def close_all_clients() -> None:
+    """
+    Close all shared clients, releasing their sockets and monitoring threads.
+
+    Registered to run at interpreter exit. Managers connected to a closed 
+    client must be reconnected with `close()` and `connect()` before reuse.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_all_clients)
 
 
 class MongoDBManager:
@@ -50,18 +102,52 @@ class MongoDBManager:
     def connect(self) -> None:
         """Establish connection to MongoDB."""
         if self._client is None:
-            self._client = MongoClient(
+            self._client = _get_client(
                 self.config.connection_string,
-                tlsAllowInvalidCertificates=self.config.tls_allow_invalid_certificates,
+                self.config.tls_allow_invalid_certificates,
             )
             # Use shop-specific database name
             database_name = self.config.database_name
             self._db = self._client[database_name]
+            if self.config.create_indexes_on_connect:
+                self.ensure_indexes()
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the configured secondary indexes, once per database and process.
+
+        Indexes are configured per collection setting, e.g. 
+        `product_collection`, and created on the collection it names. 
+        Creating an index that already exists is a cheap no-op, but building 
+        a new one blocks until it is done. Unless disabled with 
+        `create_indexes_on_connect`, this runs on the first `connect()`.
+        """
+        key = (self.config.connection_string, self.config.database_name)
+        if key in _indexed_databases:
+            return
+
+        # Resolve the database directly, since `connect()` may call back here
+        db = self._db
+        if db is None:
+            db = _get_client(
+                self.config.connection_string,
+                self.config.tls_allow_invalid_certificates,
+            )[self.config.database_name]
+        for collection_key, index_fields in self.config.indexes.items():
+            collection = db[getattr(self.config, collection_key)]
+            for index_field in index_fields:
+                collection.create_index(index_field)
+        _indexed_databases.add(key)
 
     def close(self) -> None:
-        """Close the MongoDB connection."""
+        """
+        Release the MongoDB connection.
+
+        The underlying client is shared with other managers and stays open, 
+        only this manager's references to it are dropped. Shared clients are 
+        closed with `close_all_clients()`.
+        """
         if self._client is not None:
-            self._client.close()
             self._client = None
             self._db = None
             self._collections.clear()
@@ -102,28 +188,66 @@ class MongoDBManager:
         if isinstance(docs, Document):
             result = collection.update_one(
                 {"_id": docs.hash},
-                {"$set": docs.to_mongo()},
+                self._upsert_update(docs),
                 upsert=True
             )
             return int(result.modified_count > 0 or result.upserted_id is not None)
 
-        # Assume iterable of documents
+        # Assume iterable of documents, sent in batched round trips
         count = 0
+        operations = []
         for doc in docs:
-            result = collection.update_one(
-                {"_id": doc.hash},
-                {"$set": doc.to_mongo()},
-                upsert=True
+            operations.append(
+                UpdateOne(
+                    {"_id": doc.hash}, self._upsert_update(doc), upsert=True
+                )
             )
-            if result.modified_count > 0 or result.upserted_id is not None:
-                count += 1
+            if len(operations) == _BULK_WRITE_BATCH_SIZE:
+                count += self._bulk_write(collection, operations)
+                operations = []
+
+        if operations:
+            count += self._bulk_write(collection, operations)
 
         return count
 
+    @staticmethod
+    def _upsert_update(doc: Document) -> dict[str, any]:
+        """
+        Build the update that upserts a document.
+
+        `created_at` is only written when the document is inserted, and 
+        `updated_at` is set by the server on every write. Both are left out 
+        of `$set`, which may not touch the same fields.
+        """
+        data = doc.to_mongo()
+        data.pop("created_at", None)
+        data.pop("updated_at", None)
+        return {
+            "$set": data,
+            "$setOnInsert": {"created_at": datetime.now(timezone.utc)},
+            "$currentDate": {"updated_at": True},
+        }
+
+    @staticmethod
+    def _bulk_write(
+        collection: Collection, 
+        operations: list[UpdateOne]
+    ) -> int:
+        """
+        Send upserts in one unordered bulk write.
+
+        Returns:
+            int: Number of documents inserted or updated.
+        """
+        result = collection.bulk_write(operations, ordered=False)
+        return result.modified_count + result.upserted_count
+
     def find_one(
         self, 
         collection_name: str, 
-        query: QueryType
+        query: QueryType,
+        projection: ProjectionType | None = None
     ) -> Document | None:
         """
         Find a single document in a collection.
@@ -131,19 +255,25 @@ class MongoDBManager:
         Args:
             collection_name (str): Name of the collection
             query (dict): Query to find the document
+            projection (ProjectionType | None): Fields to leave out, e.g. 
+                                                `{"debug_info": 0}`. Left out 
+                                                fields must have defaults in 
+                                                the document model. If None, 
+                                                full documents are returned.
 
         Returns:
             Document | None: Found document or None
         """
         collection = self.get_collection(collection_name)
-        data = collection.find_one(query)
+        data = collection.find_one(query, projection)
 
         return document_factory(data) if data else None
 
     def find_all(
         self, 
         collection_name: str, 
-        query: QueryType | None = None
+        query: QueryType | None = None,
+        projection: ProjectionType | None = None
     ) -> list[Document]:
         """
         Find documents in a collection.
@@ -152,13 +282,47 @@ class MongoDBManager:
             collection_name (str): Name of the collection
             query (QueryType | None): Query to filter documents. If None, 
                                       returns all documents.
+            projection (ProjectionType | None): Fields to leave out, e.g. 
+                                                `{"debug_info": 0}`. Left out 
+                                                fields must have defaults in 
+                                                the document model. If None, 
+                                                full documents are returned.
 
         Returns:
             list[Document]: List of found documents
         """
+        return list(self.iter_all(collection_name, query, projection))
+
+    def iter_all(
+        self, 
+        collection_name: str, 
+        query: QueryType | None = None,
+        projection: ProjectionType | None = None
+    ) -> Iterator[Document]:
+        """
+        Lazily iterate over documents in a collection.
+
+        Unlike `find_all()`, documents are fetched in server batches and 
+        converted as they are consumed, so memory use does not grow with 
+        the size of the collection.
+
+        Args:
+            collection_name (str): Name of the collection
+            query (QueryType | None): Query to filter documents. If None, 
+                                      iterates over all documents.
+            projection (ProjectionType | None): Fields to leave out, e.g. 
+                                                `{"debug_info": 0}`. Left out 
+                                                fields must have defaults in 
+                                                the document model. If None, 
+                                                full documents are returned.
+
+        Returns:
+            Iterator[Document]: Iterator over the found documents
+        """
         collection = self.get_collection(collection_name)
-        cursor = collection.find(query) if query else collection.find()
-        return [document_factory(doc) for doc in cursor]
+        cursor = collection.find(query or {}, projection)
+        cursor.batch_size(_FIND_BATCH_SIZE)
+        return (document_factory(doc) for doc in cursor)
     
     def delete_one(
         self, 
@@ -196,4 +360,101 @@ class MongoDBManager:
         """
         collection = self.get_collection(collection_name)
         result = collection.delete_many(query)
-        return result.deleted_count
\ No newline at end of file
+        return result.deleted_count
+
+
+class BufferedUpserter:
+    """
+    Buffers document upserts into a collection and writes them in batches.
+
+    Documents added one at a time, e.g. as they are scraped, are flushed 
+    through `MongoDBManager.upsert()` once `batch_size` documents are 
+    buffered or `interval` seconds have passed since the last flush. If the 
+    same document is added again before a flush, only its latest version is 
+    written.
+
+    Features:
+    - Size and time based flushing
+    - Context manager support, flushing the remainder on exit
+    """
+
+    def __init__(
+        self,
+        manager: MongoDBManager,
+        collection_name: str,
+        batch_size: int = 500,
+        interval: float = 2.0
+    ) -> None:
+        """
+        Initialize the buffered upserter.
+
+        Args:
+            manager (MongoDBManager): Manager to write through.
+            collection_name (str): Target MongoDB collection.
+            batch_size (int): Number of buffered documents that triggers a 
+                              flush.
+            interval (float): Seconds since the last flush after which the 
+                              next `add()` triggers a flush.
+        """
+        self.manager = manager
+        self.collection_name = collection_name
+        self.batch_size = batch_size
+        self.interval = interval
+        self._buffer: dict[str, Document] = {}
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def add(self, docs: Document | Iterable[Document]) -> int:
+        """
+        Buffer one or many documents, flushing if a threshold is reached.
+
+        Args:
+            docs (Document or Iterable[Document]): One or more Document 
+                                                   instances.
+
+        Returns:
+            int: Number of documents inserted or updated by a triggered 
+                 flush, 0 if nothing was flushed.
+        """
+        if isinstance(docs, Document):
+            docs = (docs,)
+        for doc in docs:
+            self._buffer[doc.hash] = doc
+
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.interval
+        ):
+            return self.flush()
+        return 0
+
+    def flush(self) -> int:
+        """
+        Write all buffered documents.
+
+        Returns:
+            int: Number of documents inserted or updated.
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return 0
+
+        docs = list(self._buffer.values())
+        self._buffer.clear()
+        return self.manager.upsert(self.collection_name, docs)
+
+    def close(self) -> int:
+        """
+        Flush any remaining buffered documents.
+
+        Returns:
+            int: Number of documents inserted or updated.
+        """
+        return self.flush()
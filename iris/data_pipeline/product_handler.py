@@ -20,17 +20,23 @@ class ProductHandler:
     def __init__(
         self,
         shop_config: ShopConfig,
+        scraper: BaseScraper | None = None,
     ) -> None:
         """
         Initialize the ProductHandler.
 
         Args:
             shop_config (ShopConfig): Shop config instance.
+            scraper (BaseScraper | None): Scraper to share, e.g. the one 
+                                          loading the pages. If None, a new 
+                                          one is created.
         """
         self.shop_config = shop_config
 
         # Initialize the base scraper and image handler
-        self.scraper = BaseScraper(self.shop_config.scraper_config)
+        if scraper is None:
+            scraper = BaseScraper(self.shop_config.scraper_config)
+        self.scraper = scraper
 
     def __del__(self):
         """
@@ -67,15 +73,13 @@ class ProductHandler:
             logger.warning("No product data found in the page.")
             return None
 
-        # Extract product images
-        images: list[Image] = []
+        # Extract product images, keeping the first of any image matched by 
+        # several selectors
+        images_by_hash: dict[str, Image] = {}
         for image_selector in self.shop_config.image_selectors.values():
-            images.extend(
-                ImageHandler.extract_images(
-                    soup,
-                    image_selector=image_selector
-                )
-            )
+            for image in ImageHandler.extract_images(soup, image_selector=image_selector):
+                images_by_hash.setdefault(image.hash, image)
+        images = list(images_by_hash.values())
 
         # Make product instance
         product = Product(
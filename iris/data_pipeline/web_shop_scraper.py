@@ -1,4 +1,3 @@
-import re
 import time
 from typing import Set
 from urllib.parse import urljoin, urlparse
@@ -35,6 +34,7 @@ class WebShopScraper:
         self,
         shop_config: ShopConfig,
         product_handler: ProductHandler,
+        scraper: BaseScraper | None = None,
     ) -> None:
         """
         Initialize the WebShopScraper.
@@ -42,12 +42,18 @@ class WebShopScraper:
         Args:
             shop_config (ShopConfig): Shop configuration
             product_handler (ProductHandler): Handler for processing individual products
+            scraper (BaseScraper | None): Scraper loading the pages. If None, 
+                                          the product handler's scraper is 
+                                          used, so a single browser serves 
+                                          the whole crawl.
         """
         self.shop_config = shop_config
         self.product_handler = product_handler
 
-        # Initialize the base scraper
-        self.scraper = BaseScraper(self.shop_config.scraper_config)
+        # Share the product handler's base scraper unless one is given
+        if scraper is None:
+            scraper = self.product_handler.scraper
+        self.scraper = scraper
 
         # Set to track processed URLs
         self.processed_urls: Set[str] = set()
@@ -91,8 +97,8 @@ class WebShopScraper:
         # Normalize the URL first
         normalized_url = self._normalize_url(url)
 
-        pattern = self.shop_config.scraper_config.patterns["product"]
-        return re.search(pattern, url) is not None
+        pattern = self.shop_config.scraper_config.compiled_patterns["product"]
+        return pattern.search(url) is not None
 
     def _extract_links(self, soup: BeautifulSoup) -> set[str]:
         """
@@ -111,11 +117,11 @@ class WebShopScraper:
 
         # Filter: must contain base_url and match one of the patterns
         base_url = self.shop_config.base_url
-        patterns = self.shop_config.scraper_config.patterns
+        patterns = self.shop_config.scraper_config.compiled_patterns.values()
         matched_links = {
             url for url in all_links
-            if base_url in url and any(re.search(pattern, url) 
-                                       for pattern in patterns.values())
+            if base_url in url and any(pattern.search(url) 
+                                       for pattern in patterns)
         }
 
         return matched_links
@@ -155,10 +155,10 @@ class YolosModel(BoundingBoxModel):
         
         # Initialize model and processor from local checkpoint
         self.model: YolosForObjectDetection = YolosForObjectDetection.from_pretrained(
-            self.model_config.get_checkpoint_path()
+            self.model_config.checkpoint_path
         )
         self.processor: YolosImageProcessor = AutoProcessor.from_pretrained(
-            self.model_config.get_checkpoint_path()
+            self.model_config.checkpoint_path
         )
         self.model.to(get_device(self.model_config.device))
 
@@ -227,7 +227,7 @@ class SAM2Model(LocalizationModel):
         # Initialize SAM2 model
         sam2 = sam_model_registry[
             self.model_config.model_type
-        ](checkpoint=self.model_config.get_checkpoint_path())
+        ](checkpoint=self.model_config.checkpoint_path)
         sam2.to(get_device(self.model_config.device))
         sam2.eval()
         
@@ -390,7 +390,7 @@ class Localizer:
         """
         # Always convert to numpy array first thing
         np_image = convert_image_format(
-            image.render(context), 
+            image.render(context, max_size=self.model_config.max_image_size),
             target_format="numpy", 
             ensure_rgb=True
         )
@@ -1,4 +1,5 @@
 import hashlib
+import logging
 from typing import TypeAlias
 from iris.utils.log import logger
 
@@ -34,9 +35,11 @@ class HashableMixin:
             str: MD5 hex digest representing the content hash.
         """        
         canonical = str(sorted(hash_data.items())).encode("utf-8")
-        hash_ = hashlib.md5(canonical).hexdigest()
+        hash_ = hashlib.md5(canonical, usedforsecurity=False).hexdigest()
 
-        logger.debug(f"Computed hash {hash_} from fields: {list(hash_data.keys())}")
+        # Runs for every document created, so skip formatting unless needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Computed hash {hash_} from fields: {list(hash_data.keys())}")
         return hash_
     
     def compute_hash(self) -> str:
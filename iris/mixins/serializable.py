@@ -1,5 +1,4 @@
 from pathlib import Path
-from datetime import datetime, timezone
 from typing import TypeAlias
 
 DataType: TypeAlias = dict[str, any]
@@ -47,7 +46,4 @@ class SerializableMixin:
         if doc.get("_id") is None:
             doc.pop("_id", None)
 
-        # Add timestamp field
-        doc["created_at"] = datetime.now(timezone.utc)
-
         return doc
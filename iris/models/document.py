@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field, asdict
+from datetime import datetime
 from abc import ABC, abstractmethod
 from typing import TypeAlias, Self
 
@@ -18,7 +19,8 @@ class Document(ABC, HashableMixin, SerializableMixin, EmbeddableMixin):
     """
 
     _id: str | None = None
-    created_at: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
     hash: str | None = None
     type: str
     debug_info: dict = field(default_factory=dict)
@@ -31,17 +31,30 @@ class Image(Document, RenderableMixin):
 
         return data
 
-    def render(self, context: HasImageContext, **kwargs) -> PILImage.Image:
+    def render(
+        self,
+        context: HasImageContext,
+        max_size: int | None = None,
+        **kwargs
+    ) -> PILImage.Image:
         """
         Render the image using the provided context.
 
         Args:
             context: The context containing necessary configurations and methods.
+            max_size: Longest side the caller will scale the image down to, 
+                      letting the context decode a smaller image. None 
+                      renders the full image.
 
         Returns:
             PILImage.Image: The rendered image.
         """
-        pil_image, path = context.get_pil_image(self.hash, self.storage_path, self.url)
+        if max_size is None:
+            pil_image, path = context.get_pil_image(self.hash, self.storage_path, self.url)
+        else:
+            pil_image, path = context.get_pil_image(
+                self.hash, self.storage_path, self.url, max_size=max_size
+            )
         self.storage_path = path
         return pil_image
     
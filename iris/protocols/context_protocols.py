@@ -20,7 +20,8 @@ class HasImageContext(Protocol):
         self, 
         image_id: str | None = None,
         path: Path | None = None, 
-        url: str | None = None
+        url: str | None = None,
+        max_size: int | None = None
     ) -> tuple[PILImage.Image, Path]:
         ...
 
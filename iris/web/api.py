@@ -21,9 +21,12 @@ app.add_middleware(
 )
 
 # Initialize MongoDB manager
-config_manager = DataPipelineConfigManager()
+config_manager = DataPipelineConfigManager.get()
 mongodb_manager = MongoDBManager(config_manager.mongodb_config)
 
+# Responses never include debug info, so it is not fetched
+_RESPONSE_PROJECTION = {"debug_info": 0}
+
 
 async def _get_base_response(
         url: str, 
@@ -42,6 +45,7 @@ async def _get_base_response(
         image: Image = db.find_one(
             collection_name=db.config.image_metadata_collection,
             query={"url": normalized_url},
+            projection=_RESPONSE_PROJECTION,
         )
     
     if image is None:
@@ -57,6 +61,7 @@ async def _get_base_response(
         localizations = db.find_all(
             collection_name=db.config.localization_collection,
             query={"hash": {"$in": image.localization_hashes}},
+            projection=_RESPONSE_PROJECTION,
         )
 
         has_product_detections = any(
@@ -105,13 +110,15 @@ async def check_url(
 
                 product: Product = db.find_one(
                     collection_name=db.config.product_collection,
-                    query={"hash": product_hash}
+                    query={"hash": product_hash},
+                    projection=_RESPONSE_PROJECTION
                 )
 
                 with mongodb_manager as db:
                     product_image: Image = db.find_one(
                         collection_name=db.config.image_metadata_collection,
-                        query={"hash": product.image_hashes[0]}
+                        query={"hash": product.image_hashes[0]},
+                        projection=_RESPONSE_PROJECTION
                     )
                 response["detections"].append({
                     "point": localization.point,
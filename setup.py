@@ -7,9 +7,12 @@ setup(
     install_requires=[
         "selenium",
         "beautifulsoup4",
+        "soupsieve",
+        "lxml",
         "pymongo",
         "webdriver-manager",
         "requests",
+        "aiohttp",
         "opencv-python>=4.7.0",
         "matplotlib>=3.7.0",
         "numpy>=1.24.0",
@@ -31,5 +34,9 @@ setup(
             "black>=23.0.0",
             "flake8>=6.0.0",
         ],
+        "speedups": [
+            "rtoml",
+            "simplejpeg",
+        ],
     },
 )
\ No newline at end of file